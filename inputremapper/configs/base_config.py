@@ -150,9 +150,11 @@ class ConfigBase:
         if resolved is None and self.fallback is not None:
             resolved = self.fallback._resolve(path, callback)
         if resolved is None:
-            # don't create new empty stuff in INITIAL_CONFIG with _resolve
-            initial_copy = copy.deepcopy(INITIAL_CONFIG)
-            resolved = self._resolve(path, callback, initial_copy)
+            # don't create new empty stuff in INITIAL_CONFIG like _resolve would.
+            # Walking it is enough, the result is copied below anyway.
+            resolved = INITIAL_CONFIG
+            for chunk in path if isinstance(path, list) else path.split("."):
+                resolved = resolved.get(chunk) if isinstance(resolved, dict) else None
 
         if resolved is None and log_unknown:
             logger.error('Unknown config key "%s"', path)
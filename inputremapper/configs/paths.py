@@ -24,6 +24,7 @@
 
 import os
 import shutil
+from functools import lru_cache
 
 from inputremapper.logger import logger
 from inputremapper.user import USER, CONFIG_PATH
@@ -88,7 +89,13 @@ def remove(path):
 
 def get_preset_path(group_name=None, preset=None):
     """Get a path to the stored preset, or to store a preset to."""
-    presets_base = os.path.join(CONFIG_PATH, "presets")
+    # CONFIG_PATH is part of the cache key, because it is modified in tests
+    return _get_preset_path(CONFIG_PATH, group_name, preset)
+
+
+@lru_cache(maxsize=1024)
+def _get_preset_path(config_path, group_name, preset):
+    presets_base = os.path.join(config_path, "presets")
 
     if group_name is None:
         return presets_base
@@ -23,21 +23,44 @@ from __future__ import annotations
 
 import os
 import re
+import stat
 import json
-import glob
 import time
 
 from typing import Tuple, Dict, List
 from evdev.ecodes import EV_KEY, BTN_LEFT
 
-from inputremapper.logger import logger
-from inputremapper.configs.paths import touch, get_preset_path, mkdir
+from inputremapper.logger import logger, is_debug
+from inputremapper.configs.paths import chown, get_preset_path, mkdir
 from inputremapper.configs.global_config import global_config
 from inputremapper.configs.base_config import ConfigBase
 from inputremapper.event_combination import EventCombination
 from inputremapper.injection.macros.parse import clean
 from inputremapper.groups import groups
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(data) -> bytes:
+    """Serialize presets, faster if orjson is installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        )
+
+    return (json.dumps(data, indent=4) + "\n").encode()
+
+
+def _json_loads(data: bytes):
+    """Deserialize presets, faster if orjson is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
 
 class Preset(ConfigBase):
     """Contains and manages mappings of a single preset."""
@@ -47,6 +70,9 @@ class Preset(ConfigBase):
     def __init__(self):
         # a mapping of a EventCombination object to (symbol, target) tuple
         self._mapping: Dict[EventCombination, Tuple[str, str]] = {}
+        # the canonical form of each combination, pointing to the equivalent
+        # combination that is actually used as key in _mapping
+        self._canonical_keys: Dict[EventCombination, EventCombination] = {}
         self._changed = False
 
         # are there actually any keys set in the preset file?
@@ -61,10 +87,16 @@ class Preset(ConfigBase):
     def __len__(self):
         return len(self._mapping)
 
-    def set(self, *args):
+    def set(self, path, value):
         """Set a config value. See `ConfigBase.set`."""
+        # don't use get, which would also check the fallback and defaults
+        if self._resolve(path, lambda parent, child, chunk: child) == value:
+            # setting the same value again, e.g. when the gui initializes its
+            # widgets, doesn't need to be saved
+            return
+
         self._changed = True
-        return super().set(*args)
+        return super().set(path, value)
 
     def remove(self, *args):
         """Remove a config value. See `ConfigBase.remove`."""
@@ -115,9 +147,12 @@ class Preset(ConfigBase):
 
         self.clear(new_combination)  # this also clears all equivalent keys
 
-        logger.debug('changing %s to "%s"', new_combination, clean(symbol))
+        if is_debug():
+            # cleaning the macro is only needed for the log, and the editor
+            # changes the preset a lot while typing
+            logger.debug('changing %s to "%s"', new_combination, clean(symbol))
 
-        self._mapping[new_combination] = output
+        self._set_mapping(new_combination, output)
 
         if key_changed and previous_combination is not None:
             # clear previous mapping of that code, because the line
@@ -146,17 +181,27 @@ class Preset(ConfigBase):
                 f"Expected combination to be a EventCombination object but got {combination}"
             )
 
-        for permutation in combination.get_permutations():
-            if permutation in self._mapping:
-                logger.debug("%s cleared", permutation)
-                del self._mapping[permutation]
-                self._changed = True
-                # there should be only one variation of the permutations
-                # in the preset actually
+        # there is only one variation of the permutations in the preset
+        stored = self._canonical_keys.pop(combination.get_canonical(), combination)
+        if stored in self._mapping:
+            logger.debug("%s cleared", stored)
+            del self._mapping[stored]
+            self._changed = True
+
+    def _set_mapping(self, combination, output):
+        """Map the combination, replacing any equivalent combination."""
+        canonical = combination.get_canonical()
+        previous = self._canonical_keys.get(canonical)
+        if previous is not None:
+            del self._mapping[previous]
+
+        self._canonical_keys[canonical] = combination
+        self._mapping[combination] = output
 
     def empty(self):
         """Remove all mappings and custom configs without saving."""
         self._mapping = {}
+        self._canonical_keys = {}
         self._changed = True
         self.clear_config()
 
@@ -175,8 +220,8 @@ class Preset(ConfigBase):
         self.empty()
         self._changed = False
 
-        with open(path, "r") as file:
-            preset_dict = json.load(file)
+        with open(path, "rb") as file:
+            preset_dict = _json_loads(file.read())
 
             if not isinstance(preset_dict.get("mapping"), dict):
                 logger.error(
@@ -198,7 +243,7 @@ class Preset(ConfigBase):
                     symbol = tuple(symbol)  # use a immutable type
 
                 logger.debug("%s maps to %s", combination, symbol)
-                self._mapping[combination] = symbol
+                self._set_mapping(combination, symbol)
 
             # add any metadata of the preset
             for key in preset_dict:
@@ -213,28 +258,53 @@ class Preset(ConfigBase):
         """Dump as JSON into home."""
         logger.info("Saving preset to %s", path)
 
-        touch(path)
-
-        with open(path, "w") as file:
-            if self._config.get("mapping") is not None:
-                logger.error(
-                    '"mapping" is reserved and cannot be used as config ' "key: %s",
-                    self._config.get("mapping"),
-                )
-
-            preset_dict = self._config.copy()  # shallow copy
-
-            # make sure to keep the option to add metadata if ever needed,
-            # so put the mapping into a special key
-            json_ready_mapping = {}
-            # tuple keys are not possible in json, encode them as string
-            for combination, value in self._mapping.items():
-                new_key = combination.json_str()
-                json_ready_mapping[new_key] = value
+        if self._config.get("mapping") is not None:
+            logger.error(
+                '"mapping" is reserved and cannot be used as config ' "key: %s",
+                self._config.get("mapping"),
+            )
 
-            preset_dict["mapping"] = json_ready_mapping
-            json.dump(preset_dict, file, indent=4)
-            file.write("\n")
+        preset_dict = self._config.copy()  # shallow copy
+
+        # make sure to keep the option to add metadata if ever needed,
+        # so put the mapping into a special key.
+        # tuple keys are not possible in json, encode them as string
+        preset_dict["mapping"] = {
+            combination.json_str(): value
+            for combination, value in self._mapping.items()
+        }
+
+        # serialize everything first and write it at once
+        dump = _json_dumps(preset_dict)
+
+        # replace the file a symlink points to, not the symlink itself
+        path = os.path.realpath(path)
+        mkdir(os.path.dirname(path), log=False)
+
+        # keep the permissions of the existing preset. New presets are only
+        # readable by the user, like touch() made them, since macros might
+        # contain typed text
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o600
+
+        # write into a temporary file and replace the preset with it, so that
+        # crashing while writing doesn't leave a broken preset behind
+        tmp_path = f"{path}.tmp"
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+            with os.fdopen(fd, "wb") as file:
+                # the umask applies to os.open, and an old temporary file
+                # would keep its mode
+                os.fchmod(file.fileno(), mode)
+                file.write(dump)
+
+            chown(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
         self._changed = False
         self.num_saved_keys = len(self)
@@ -251,18 +321,16 @@ class Preset(ConfigBase):
                 f"Expected combination to be a EventCombination object but got {combination}"
             )
 
-        for permutation in combination.get_permutations():
-            existing = self._mapping.get(permutation)
-            if existing is not None:
-                return existing
-
-        return None
+        stored = self._canonical_keys.get(combination.get_canonical(), combination)
+        return self._mapping.get(stored)
 
     def dangerously_mapped_btn_left(self):
         """Return True if this mapping disables BTN_Left."""
         if self.get_mapping(EventCombination([EV_KEY, BTN_LEFT, 1])) is not None:
-            values = [value[0].lower() for value in self._mapping.values()]
-            return "btn_left" not in values
+            # BTN_LEFT is still available if anything else is mapped to it
+            return not any(
+                value[0].lower() == "btn_left" for value in self._mapping.values()
+            )
 
         return False
 
@@ -274,6 +342,12 @@ class Preset(ConfigBase):
 ###########################################################################
 
 
+# "foo copy", "foo copy 2"
+COPY_SUFFIX = re.compile(r"^.+\scopy( \d+)?$")
+# "foo 2"
+TRAILING_NUMBER = re.compile(r"^(.+) (\d+)$")
+
+
 def get_available_preset_name(group_name, preset="new preset", copy=False):
     """Increment the preset name until it is available."""
     if group_name is None:
@@ -282,14 +356,14 @@ def get_available_preset_name(group_name, preset="new preset", copy=False):
 
     preset = preset.strip()
 
-    if copy and not re.match(r"^.+\scopy( \d+)?$", preset):
+    if copy and not COPY_SUFFIX.match(preset):
         preset = f"{preset} copy"
 
     # find a name that is not already taken
     if os.path.exists(get_preset_path(group_name, preset)):
         # if there already is a trailing number, increment it instead of
         # adding another one
-        match = re.match(r"^(.+) (\d+)$", preset)
+        match = TRAILING_NUMBER.match(preset)
         if match:
             preset = match[1]
             i = int(match[2]) + 1
@@ -304,6 +378,25 @@ def get_available_preset_name(group_name, preset="new preset", copy=False):
     return preset
 
 
+def _get_preset_files(device_folder: str) -> List[Tuple[float, str]]:
+    """Get (modification time, path) tuples of all presets in the folder.
+
+    Uses scandir to get the modification time along with the directory listing.
+    """
+    if not os.path.isdir(device_folder):
+        return []
+
+    with os.scandir(device_folder) as entries:
+        return [
+            (entry.stat().st_mtime, entry.path)
+            for entry in entries
+            # like glob, ignore hidden files
+            if entry.name.endswith(".json")
+            and not entry.name.startswith(".")
+            and entry.is_file()
+        ]
+
+
 def get_presets(group_name: str) -> List[str]:
     """Get all preset filenames for the device and user, starting with the newest.
 
@@ -314,11 +407,9 @@ def get_presets(group_name: str) -> List[str]:
     device_folder = get_preset_path(group_name)
     mkdir(device_folder)
 
-    paths = glob.glob(os.path.join(device_folder, "*.json"))
-    presets = [
-        os.path.splitext(os.path.basename(path))[0]
-        for path in sorted(paths, key=os.path.getmtime)
-    ]
+    preset_files = _get_preset_files(device_folder)
+    preset_files.sort(key=lambda preset_file: preset_file[0])
+    presets = [os.path.splitext(os.path.basename(path))[0] for _, path in preset_files]
     # the highest timestamp to the front
     presets.reverse()
     return presets
@@ -329,7 +420,7 @@ def get_any_preset() -> Tuple[str | None, str | None]:
     group_names = groups.list_group_names()
     if len(group_names) == 0:
         return None, None
-    any_device = list(group_names)[0]
+    any_device = group_names[0]
     any_preset = (get_presets(any_device) or [None])[0]
     return any_device, any_preset
 
@@ -347,20 +438,24 @@ def find_newest_preset(group_name=None):
     """
     # sort the oldest files to the front in order to use pop to get the newest
     if group_name is None:
-        paths = sorted(
-            glob.glob(os.path.join(get_preset_path(), "*/*.json")), key=os.path.getmtime
-        )
+        preset_files = []
+        if os.path.isdir(get_preset_path()):
+            with os.scandir(get_preset_path()) as entries:
+                for entry in entries:
+                    if not entry.name.startswith(".") and entry.is_dir():
+                        preset_files += _get_preset_files(entry.path)
     else:
-        paths = sorted(
-            glob.glob(os.path.join(get_preset_path(group_name), "*.json")),
-            key=os.path.getmtime,
-        )
+        preset_files = _get_preset_files(get_preset_path(group_name))
+
+    preset_files.sort(key=lambda preset_file: preset_file[0])
+    paths = [path for _, path in preset_files]
 
     if len(paths) == 0:
         logger.debug("No presets found")
         return get_any_preset()
 
-    group_names = groups.list_group_names()
+    # checked for each path until an existing group is found
+    group_names = set(groups.list_group_names())
 
     newest_path = None
     while len(paths) > 0:
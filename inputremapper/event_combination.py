@@ -22,6 +22,7 @@ from __future__ import annotations
 
 import itertools
 
+from functools import cached_property
 from typing import Tuple, Iterable
 
 import evdev
@@ -52,18 +53,9 @@ class EventCombination(Tuple[InputEvent]):
     def __new__(cls, *init_args) -> EventCombination:
         events = []
         for init_arg in init_args:
-            event = None
-
-            for constructor in InputEvent.__get_validators__():
-                try:
-                    event = constructor(init_arg)
-                    break
-                except InputEventCreationError:
-                    pass
-
-            if event:
-                events.append(event)
-            else:
+            try:
+                events.append(InputEvent.validate(init_arg))
+            except InputEventCreationError:
                 raise ValueError(f"failed to create InputEvent with {init_arg = }")
 
         return super().__new__(cls, events)
@@ -80,8 +72,15 @@ class EventCombination(Tuple[InputEvent]):
 
     @classmethod
     def from_string(cls, init_string: str) -> EventCombination:
-        init_args = init_string.split("+")
-        return cls(*init_args)
+        # This is how all combinations are read from presets. Each part can only
+        # ever be parsed by InputEvent.from_string, so don't try all the other
+        # constructors first.
+        try:
+            events = [InputEvent.from_string(arg) for arg in init_string.split("+")]
+        except InputEventCreationError:
+            raise ValueError(f"failed to create EventCombination with {init_string = }")
+
+        return super().__new__(cls, events)
 
     @classmethod
     def from_events(
@@ -119,12 +118,33 @@ class EventCombination(Tuple[InputEvent]):
         if len(self) <= 2:
             return [self]
 
+        return self._permutations
+
+    @cached_property
+    def _permutations(self):
+        # the combination is immutable, so this only needs to be done once
         permutations = []
         for permutation in itertools.permutations(self[:-1]):
             permutations.append(EventCombination(*permutation, self[-1]))
 
         return permutations
 
+    def get_canonical(self) -> EventCombination:
+        """Get the permutation that represents all equivalent combinations.
+
+        All combinations returned by get_permutations share the same canonical
+        combination, so it can be used to look them up with a single probe.
+        """
+        if len(self) <= 2:
+            return self
+
+        return self._canonical
+
+    @cached_property
+    def _canonical(self):
+        events = sorted(self[:-1], key=lambda event: event.event_tuple)
+        return EventCombination(*events, self[-1])
+
     def json_str(self) -> str:
         return "+".join([event.json_str() for event in self])
 
@@ -753,6 +753,9 @@ class UserInterface:
             self.show_status(CTX_ERROR, _("Permission denied!"), error)
             logger.error(error)
 
+        # the keyboard has hundreds of capabilities, don't scan that list
+        # again for each mapping
+        target_codes = {}
         for _x, mapping in active_preset:
             if not mapping:
                 continue
@@ -763,10 +766,14 @@ class UserInterface:
                 continue
 
             code = system_mapping.get(symbol)
-            if (
-                code is None
-                or code not in global_uinputs.get_uinput(target).capabilities()[EV_KEY]
-            ):
+            if code is not None and target not in target_codes:
+                uinput = global_uinputs.get_uinput(target)
+                # an unknown target, e.g. in a hand-edited preset, can't
+                # inject anything
+                capabilities = uinput.capabilities() if uinput else {}
+                target_codes[target] = set(capabilities.get(EV_KEY, []))
+
+            if code is None or code not in target_codes[target]:
                 trimmed = re.sub(r"\s+", " ", symbol).strip()
                 self.show_status(CTX_MAPPING, _("Unknown mapping %s") % trimmed)
                 break
@@ -79,9 +79,10 @@ class ConsumerControl:
         Can be stopped by stopping the asyncio loop. This loop
         reads events from a single device only.
         """
+        loop = asyncio.get_running_loop()
         for consumer in self._consumers:
             # run all of them in parallel
-            asyncio.ensure_future(consumer.run())
+            loop.create_task(consumer.run())
 
         logger.debug(
             "Starting to listen for events from %s, fd %s",
@@ -98,18 +99,17 @@ class ConsumerControl:
 
             handled = False
             for consumer in self._consumers:
+                if not consumer.is_handled(event):
+                    continue
+
                 # copy so that the consumer doesn't screw this up for
-                # all other future consumers
+                # all other future consumers. Only needed for the consumers
+                # that actually get the event, most events are forwarded
                 event_copy = evdev.InputEvent(
-                    sec=event.sec,
-                    usec=event.usec,
-                    type=event.type,
-                    code=event.code,
-                    value=event.value,
+                    event.sec, event.usec, event.type, event.code, event.value
                 )
-                if consumer.is_handled(event_copy):
-                    await consumer.notify(event_copy)
-                    handled = True
+                await consumer.notify(event_copy)
+                handled = True
 
             if not handled:
                 # forward the rest
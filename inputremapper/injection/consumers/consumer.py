@@ -70,6 +70,8 @@ class Consumer:
         If this returns true, the event will not be forwarded anymore
         automatically. If you want to forward the event after all you can
         inject it into `self.forward_to`.
+
+        The event is shared with all other consumers, don't modify it here.
         """
         raise NotImplementedError
 
@@ -235,7 +235,7 @@ class JoystickToMouse(Consumer):
 
             abs_values = self.get_abs_values()
 
-            if len([val for val in abs_values if not -1 <= val <= 1]) > 0:
+            if not all(-1 <= val <= 1 for val in abs_values):
                 logger.error("Inconsistent values: %s", abs_values)
                 continue
 
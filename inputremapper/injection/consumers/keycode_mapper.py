@@ -31,7 +31,7 @@ from evdev.ecodes import EV_KEY, EV_ABS
 
 import inputremapper.exceptions
 
-from inputremapper.logger import logger
+from inputremapper.logger import logger, is_debug
 from inputremapper.configs.system_mapping import DISABLE_CODE
 from inputremapper import utils
 from inputremapper.injection.consumers.consumer import Consumer
@@ -319,9 +319,12 @@ class KeycodeMapper(Consumer):
     def macro_write(self, target_uinput):
         def f(ev_type, code, value):
             """Handler for macros."""
-            logger.debug(
-                f"Macro sending %s to %s", (ev_type, code, value), target_uinput
-            )
+            if is_debug():
+                # macros can write a lot of events, don't build the log
+                # arguments for nothing
+                logger.debug(
+                    "Macro sending %s to %s", (ev_type, code, value), target_uinput
+                )
             global_uinputs.write((ev_type, code, value), target_uinput)
 
         return f
@@ -343,12 +346,16 @@ class KeycodeMapper(Consumer):
             3-tuple of type, code, action
             Action should be one of -1, 0 or 1
         """
-        unreleased_entry = find_by_event(key)
-
         # The key used to index the mappings `key_to_code` and `macros`.
         # If the key triggers a combination, the returned key will be that one
         # instead
         action = key[2]
+        if utils.is_key_up(action):
+            # releases are never stored in unreleased and can't trigger
+            # anything, so there is nothing to look up
+            return (key,)
+
+        unreleased_entry = find_by_event(key)
         key = (key,)
 
         if unreleased_entry and unreleased_entry.triggered_key is not None:
@@ -418,7 +425,6 @@ class KeycodeMapper(Consumer):
         active_macro = active_macros.get(type_and_code)
         original_tuple = (event.type, event.code, event.value)
         key = self._get_key((*type_and_code, action))
-        is_mapped = self.context.is_mapped(key)
 
         """Releasing keys and macros"""
 
@@ -474,6 +480,12 @@ class KeycodeMapper(Consumer):
             # everything that can be released is released now
             return
 
+        # the targets of the key, if any. Both are needed in the following
+        # branches, so look them up only once
+        macro_target = self.context.macros.get(key)
+        code_target = self.context.key_to_code.get(key)
+        is_mapped = macro_target is not None or code_target is not None
+
         """Filtering duplicate key downs"""
 
         if is_mapped and utils.is_key_down(action):
@@ -489,15 +501,14 @@ class KeycodeMapper(Consumer):
                 return
 
             # it would start a macro usually
-            in_macros = key in self.context.macros
             running = active_macro and active_macro.running
-            if in_macros and running:
+            if running and macro_target is not None:
                 # for key-down events and running macros, don't do anything.
                 # This avoids spawning a second macro while the first one is
                 # not finished, especially since gamepad-triggers report a ton
                 # of events with a positive value.
                 logger.debug_key(key, "macro already running")
-                self.context.macros[key][0].press_trigger()
+                macro_target[0].press_trigger()
                 return
 
         """starting new macros or injecting new keys"""
@@ -507,19 +518,21 @@ class KeycodeMapper(Consumer):
             # triggering a combination, so they should be remembered in
             # unreleased
 
-            if key in self.context.macros:
-                macro, target_uinput = self.context.macros[key]
+            if macro_target is not None:
+                macro, target_uinput = macro_target
                 active_macros[type_and_code] = macro
                 Unreleased((None, None, None), (*type_and_code, action), key)
                 macro.press_trigger()
                 logger.debug_key(
                     key, "maps to macro (%s, %s)", macro.code, target_uinput
                 )
-                asyncio.ensure_future(macro.run(self.macro_write(target_uinput)))
+                # handle_keycode is always called from within the running loop
+                loop = asyncio.get_running_loop()
+                loop.create_task(macro.run(self.macro_write(target_uinput)))
                 return
 
-            if key in self.context.key_to_code:
-                target_code, target_uinput = self.context.key_to_code[key]
+            if code_target is not None:
+                target_code, target_uinput = code_target
                 # remember the key that triggered this
                 # (this combination or this single key)
                 Unreleased(
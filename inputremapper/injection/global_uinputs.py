@@ -46,16 +46,25 @@ DEFAULT_UINPUTS = {
 
 class UInput(evdev.UInput):
     def __init__(self, *args, **kwargs):
-        logger.debug(f"creating UInput device: '{kwargs['name']}'")
+        logger.debug("creating UInput device: '%s'", kwargs["name"])
         super().__init__(*args, **kwargs)
+        self._emittable = None
 
     def can_emit(self, event):
         """check if an event can be emitted by the uinput
 
         Wrong events might be injected if the group mappings are wrong
         """
+        if self._emittable is None:
+            # the capabilities of a uinput don't change, but reading them
+            # requires ioctls. Cache them as sets, this runs for every event.
+            self._emittable = {
+                ev_type: set(codes) for ev_type, codes in self.capabilities().items()
+            }
+
         # TODO check for event value especially for EV_ABS
-        return event[1] in self.capabilities().get(event[0], [])
+        codes = self._emittable.get(event[0])
+        return codes is not None and event[1] in codes
 
 
 class FrontendUInput:
@@ -66,7 +75,7 @@ class FrontendUInput:
         self.events = events
         self.name = name
 
-        logger.debug(f"creating fake UInput device: '{self.name}'")
+        logger.debug("creating fake UInput device: '%s'", self.name)
 
     def capabilities(self):
         return self.events
@@ -271,7 +271,7 @@ class Macro:
                 if asyncio.iscoroutine(coroutine):
                     await coroutine
             except Exception as e:
-                logger.error(f'Macro "%s" failed: %s', self.code, e)
+                logger.error('Macro "%s" failed: %s', self.code, e)
                 break
 
         # done
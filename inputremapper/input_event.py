@@ -21,15 +21,17 @@ from __future__ import annotations
 
 import evdev
 
-from dataclasses import dataclass
-from typing import Tuple
+from dataclasses import FrozenInstanceError
+from typing import Tuple, Dict
 
 from inputremapper.exceptions import InputEventCreationError
 
 
-@dataclass(
-    frozen=True
-)  # Todo: add slots=True as soon as python 3.10 is in common distros
+# The same few buttons are pressed over and over again. Share the type_and_code
+# tuples between all those events instead of having one for each event.
+_type_and_code_tuples: Dict[Tuple[int, int], Tuple[int, int]] = {}
+
+
 class InputEvent:
     """
     the evnet used by inputremapper
@@ -37,28 +39,90 @@ class InputEvent:
     as a drop in replacement for evdev.InputEvent
     """
 
+    # thousands of them are created while reading and injecting. Avoid having a
+    # __dict__ for each of them. This used to be a frozen dataclass, but
+    # slots=True requires python 3.10.
+    __slots__ = (
+        "sec",
+        "usec",
+        "type",
+        "code",
+        "value",
+        "_event_tuple",
+        "_hash",
+        "_type_and_code",
+    )
+
     sec: int
     usec: int
     type: int
     code: int
     value: int
 
+    def __init__(self, sec: int, usec: int, type: int, code: int, value: int):
+        object.__setattr__(self, "sec", sec)
+        object.__setattr__(self, "usec", usec)
+        object.__setattr__(self, "type", type)
+        object.__setattr__(self, "code", code)
+        object.__setattr__(self, "value", value)
+
+        # used for each dict lookup and comparison, so only build it once
+        event_tuple = (type, code, value)
+        object.__setattr__(self, "_event_tuple", event_tuple)
+        object.__setattr__(self, "_hash", hash(event_tuple))
+
+        type_and_code = (type, code)
+        object.__setattr__(
+            self,
+            "_type_and_code",
+            _type_and_code_tuples.setdefault(type_and_code, type_and_code),
+        )
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __reduce__(self):
+        # the default reduction would use the blocked __setattr__ to restore slots
+        return self.__class__, (self.sec, self.usec, self.type, self.code, self.value)
+
+    def __repr__(self):
+        return (
+            f"InputEvent(sec={self.sec!r}, usec={self.usec!r}, type={self.type!r}, "
+            f"code={self.code!r}, value={self.value!r})"
+        )
+
     def __hash__(self):
-        return hash((self.type, self.code, self.value))
+        return self._hash
 
     def __eq__(self, other):
-        if isinstance(other, InputEvent) or isinstance(other, evdev.InputEvent):
-            return self.event_tuple == (other.type, other.code, other.value)
+        if isinstance(other, InputEvent):
+            return self._event_tuple == other._event_tuple
+        if isinstance(other, evdev.InputEvent):
+            return self._event_tuple == (other.type, other.code, other.value)
         if isinstance(other, tuple):
-            return self.event_tuple == other
+            return self._event_tuple == other
         return False
 
     @classmethod
     def __get_validators__(cls):
-        """used by pydantic and EventCombination to create InputEvent objects"""
-        yield cls.from_event
-        yield cls.from_tuple
-        yield cls.from_string
+        """used by pydantic to create InputEvent objects"""
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, init_arg) -> InputEvent:
+        """create a InputEvent from any of the supported types"""
+        # decide by type instead of trying each constructor, because raising
+        # and catching an exception for each one that doesn't fit is slow
+        if isinstance(init_arg, InputEvent):
+            return init_arg
+        if isinstance(init_arg, str):
+            return cls.from_string(init_arg)
+        if isinstance(init_arg, (tuple, list)):
+            return cls.from_tuple(init_arg)
+        return cls.from_event(init_arg)
 
     @classmethod
     def from_event(cls, event: evdev.InputEvent) -> InputEvent:
@@ -74,8 +138,8 @@ class InputEvent:
     def from_string(cls, string: str) -> InputEvent:
         """create a InputEvent from a string like 'type, code, value'"""
         try:
-            t, c, v = string.split(",")
-            return cls(0, 0, int(t), int(c), int(v))
+            t, c, v = map(int, string.split(","))
+            return cls(0, 0, t, c, v)
         except (ValueError, AttributeError):
             raise InputEventCreationError(
                 f"failed to create InputEvent from {string = !r}"
@@ -109,12 +173,12 @@ class InputEvent:
     @property
     def type_and_code(self) -> Tuple[int, int]:
         """event type, code"""
-        return self.type, self.code
+        return self._type_and_code
 
     @property
     def event_tuple(self) -> Tuple[int, int, int]:
         """event type, code, value"""
-        return self.type, self.code, self.value
+        return self._event_tuple
 
     def __str__(self):
         if self.type == evdev.ecodes.EV_KEY:
@@ -37,6 +37,7 @@ even those written by themselves.
 """
 
 
+import collections
 import os
 import time
 import json
@@ -51,7 +52,7 @@ class Pipe:
     def __init__(self, path):
         """Create a pipe, or open it if it already exists."""
         self._path = path
-        self._unread = []
+        self._unread = collections.deque()
         self._created_at = time.time()
 
         paths = (f"{path}r", f"{path}w")
@@ -95,7 +96,7 @@ class Pipe:
         are allowed.
         """
         if len(self._unread) > 0:
-            return self._unread.pop(0)
+            return self._unread.popleft()
 
         line = self._handles[0].readline()
         if len(line) == 0:
@@ -50,6 +50,7 @@ are much easier to handle.
 # by _Server all the time.
 
 
+import collections
 import select
 import socket
 import os
@@ -80,8 +81,8 @@ class Base:
 
     def __init__(self, path):
         self._path = path
-        self._unread = []
-        self.unsent = []
+        self._unread = collections.deque()
+        self.unsent = collections.deque()
         mkdir(os.path.dirname(path))
         self.connection = None
         self.socket = None
@@ -155,7 +156,7 @@ class Base:
         if len(self._unread) == 0:
             return None
 
-        return self._unread.pop(0)
+        return self._unread.popleft()
 
     def poll(self):
         """Check if a message to read is available."""
@@ -179,7 +180,7 @@ class Base:
                 unsent = self.unsent[0]
                 self.connection.sendall(unsent + END)
                 # sending worked, remove message
-                self.unsent.pop(0)
+                self.unsent.popleft()
 
         # attempt sending twice in case it fails
         try:
@@ -58,6 +58,15 @@ def debug_key(self, key, msg, *args):
 
     global previous_key_debug_log
 
+    # compare before formatting anything, the repeated messages are dropped
+    # anyway
+    log = (key, msg, args)
+    if log == previous_key_debug_log:
+        # avoid some super spam from EV_ABS events
+        return
+
+    previous_key_debug_log = log
+
     msg = msg % args
     str_key = str(key)
     str_key = str_key.replace(",)", ")")
@@ -66,12 +75,6 @@ def debug_key(self, key, msg, *args):
         spacing = ""
     msg = f"{msg}{spacing} {str_key}"
 
-    if msg == previous_key_debug_log:
-        # avoid some super spam from EV_ABS events
-        return
-
-    previous_key_debug_log = msg
-
     self._log(logging.DEBUG, msg, args=None)
 
 
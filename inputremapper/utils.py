@@ -36,6 +36,13 @@ from evdev.ecodes import (
     EV_REL,
     REL_WHEEL,
     REL_HWHEEL,
+    ABS_MISC,
+    ABS_DISTANCE,
+    ABS_TILT_X,
+    ABS_TILT_Y,
+    ABS_PRESSURE,
+    BTN_DIGI,
+    BTN_TOUCH,
 )
 
 from inputremapper.logger import logger
@@ -43,22 +50,19 @@ from inputremapper.configs.global_config import BUTTONS
 
 
 # other events for ABS include buttons
-JOYSTICK = [
-    evdev.ecodes.ABS_X,
-    evdev.ecodes.ABS_Y,
-    evdev.ecodes.ABS_RX,
-    evdev.ecodes.ABS_RY,
-]
+JOYSTICK = frozenset((ABS_X, ABS_Y, ABS_RX, ABS_RY))
 
 
 # drawing table stylus movements
-STYLUS = [
-    (EV_ABS, evdev.ecodes.ABS_DISTANCE),
-    (EV_ABS, evdev.ecodes.ABS_TILT_X),
-    (EV_ABS, evdev.ecodes.ABS_TILT_Y),
-    (EV_KEY, evdev.ecodes.BTN_DIGI),
-    (EV_ABS, evdev.ecodes.ABS_PRESSURE),
-]
+STYLUS = frozenset(
+    (
+        (EV_ABS, ABS_DISTANCE),
+        (EV_ABS, ABS_TILT_X),
+        (EV_ABS, ABS_TILT_Y),
+        (EV_KEY, BTN_DIGI),
+        (EV_ABS, ABS_PRESSURE),
+    )
+)
 
 
 # a third of a quarter circle, so that each quarter is divided in 3 areas:
@@ -153,15 +157,24 @@ def should_map_as_btn(event, preset, gamepad):
     gamepad : bool
         If the device is treated as gamepad
     """
-    if (event.type, event.code) in STYLUS:
-        return False
+    # check the type first, so that each event only goes through the rules
+    # of its own type
+    if event.type == EV_KEY:
+        # usually all EV_KEY events are allright, except for
+        if event.code == BTN_TOUCH:
+            return False
 
-    is_mousepad = event.type == EV_ABS and 47 <= event.code <= 61
-    if is_mousepad:
-        return False
+        return (EV_KEY, event.code) not in STYLUS
 
     if event.type == EV_ABS:
-        if event.code == evdev.ecodes.ABS_MISC:
+        if (EV_ABS, event.code) in STYLUS:
+            return False
+
+        is_mousepad = 47 <= event.code <= 61
+        if is_mousepad:
+            return False
+
+        if event.code == ABS_MISC:
             # what is that even supposed to be.
             # the intuos 5 spams those with every event
             return False
@@ -178,22 +191,14 @@ def should_map_as_btn(event, preset, gamepad):
 
             if event.code in [ABS_RX, ABS_RY] and r_purpose == BUTTONS:
                 return True
-        else:
-            # for non-joystick buttons just always offer mapping them to
-            # buttons
-            return True
-
-    if is_wheel(event):
-        return True
 
-    if event.type == EV_KEY:
-        # usually all EV_KEY events are allright, except for
-        if event.code == evdev.ecodes.BTN_TOUCH:
             return False
 
+        # for non-joystick buttons just always offer mapping them to
+        # buttons
         return True
 
-    return False
+    return is_wheel(event)
 
 
 def get_abs_range(device, code=ABS_X):
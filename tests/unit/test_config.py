@@ -40,6 +40,12 @@ class TestConfig(unittest.TestCase):
         global_config.set("gamepad.joystick.non_linearity", 3)
         self.assertEqual(global_config.get("gamepad.joystick.non_linearity"), 3)
 
+        # modifying the result doesn't modify the defaults
+        global_config._config = {}
+        joystick = global_config.get("gamepad.joystick")
+        joystick["non_linearity"] = 5
+        self.assertEqual(global_config.get("gamepad.joystick.non_linearity"), 4)
+
     def test_basic(self):
         self.assertEqual(global_config.get("a"), None)
 
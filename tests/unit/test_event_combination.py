@@ -76,6 +76,22 @@ class TestKey(unittest.TestCase):
             EventCombination((1, 3, 1), (1, 5, 1), (1, 7, 1)),
         )
         self.assertEqual(key_3.get_permutations()[1], ((1, 5, 1), (1, 3, 1), (1, 7, 1)))
+        # computed only once
+        self.assertIs(key_3.get_permutations(), key_3.get_permutations())
+
+    def test_get_canonical(self):
+        key_1 = EventCombination((1, 3, 1), (1, 5, 1))
+        self.assertIs(key_1.get_canonical(), key_1)
+
+        key_2 = EventCombination((1, 5, 1), (1, 3, 1), (1, 7, 1))
+        key_3 = EventCombination((1, 3, 1), (1, 5, 1), (1, 7, 1))
+        key_4 = EventCombination((1, 3, 1), (1, 7, 1), (1, 5, 1))
+        self.assertEqual(key_2.get_canonical(), key_3)
+        self.assertEqual(key_3.get_canonical(), key_3)
+        # the last event is not interchangeable
+        self.assertNotEqual(key_4.get_canonical(), key_3)
+        for permutation in key_2.get_permutations():
+            self.assertEqual(permutation.get_canonical(), key_2.get_canonical())
 
     def test_is_problematic(self):
         key_1 = EventCombination((1, KEY_LEFTSHIFT, 1), (1, 5, 1))
@@ -113,6 +129,17 @@ class TestKey(unittest.TestCase):
         EventCombination("1, 2, 3", (1, 3, 4), InputEvent.from_string(" 1,5 , 1 "))
         EventCombination((1, 2, 3), (1, 2, "3"))
 
+    def test_from_string(self):
+        c1 = EventCombination.from_string("1,2,3+4,5,6")
+        self.assertIsInstance(c1, EventCombination)
+        self.assertEqual(c1, EventCombination((1, 2, 3), (4, 5, 6)))
+        self.assertEqual(
+            EventCombination.from_string(c1.json_str()).json_str(), c1.json_str()
+        )
+
+        self.assertRaises(ValueError, lambda: EventCombination.from_string("1,2"))
+        self.assertRaises(ValueError, lambda: EventCombination.from_string("1,2,3+"))
+
     def test_json_str(self):
         c1 = EventCombination((1, 2, 3))
         c2 = EventCombination((1, 2, 3), (4, 5, 6))
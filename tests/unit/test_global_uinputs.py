@@ -59,6 +59,22 @@ class TestFrontendUinput(unittest.TestCase):
         self.assertEqual(uinput_custom.capabilities(), capabilities)
 
 
+class TestUInput(unittest.TestCase):
+    def setUp(self) -> None:
+        cleanup()
+
+    def test_can_emit(self):
+        uinput = UInput(name="foo", events={EV_KEY: [KEY_A]})
+        with patch.object(
+            uinput, "capabilities", wraps=uinput.capabilities
+        ) as capabilities:
+            self.assertTrue(uinput.can_emit((EV_KEY, KEY_A, 1)))
+            self.assertFalse(uinput.can_emit((EV_KEY, KEY_A + 1, 1)))
+            self.assertFalse(uinput.can_emit((EV_ABS, ABS_X, 1)))
+            # capabilities of uinputs are constant, they are only read once
+            self.assertEqual(capabilities.call_count, 1)
+
+
 class TestGlobalUinputs(unittest.TestCase):
     def setUp(self) -> None:
         cleanup()
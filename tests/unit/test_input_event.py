@@ -18,6 +18,8 @@
 # You should have received a copy of the GNU General Public License
 # along with input-remapper.  If not, see <https://www.gnu.org/licenses/>.
 
+import copy
+import pickle
 import unittest
 
 import evdev
@@ -84,12 +86,27 @@ class TestInputEvent(unittest.TestCase):
         self.assertRaises(InputEventCreationError, InputEvent.from_string, t3)
         self.assertRaises(InputEventCreationError, InputEvent.from_string, t4)
 
+    def test_validate(self):
+        e1 = InputEvent(1, 2, 3, 4, 5)
+        self.assertIs(InputEvent.validate(e1), e1)
+        self.assertEqual(InputEvent.validate(evdev.InputEvent(1, 2, 3, 4, 5)), e1)
+        self.assertEqual(InputEvent.validate("3,4,5"), e1)
+        self.assertEqual(InputEvent.validate((3, 4, 5)), e1)
+        self.assertEqual(InputEvent.validate([3, 4, 5]), e1)
+
+        self.assertRaises(InputEventCreationError, InputEvent.validate, None)
+        self.assertRaises(InputEventCreationError, InputEvent.validate, 1)
+        self.assertRaises(InputEventCreationError, InputEvent.validate, (1, 2))
+        self.assertRaises(InputEventCreationError, InputEvent.validate, "1,2")
+
     def test_properties(self):
         e1 = InputEvent.btn_left()
         self.assertEqual(
             e1.event_tuple, (evdev.ecodes.EV_KEY, evdev.ecodes.BTN_LEFT, 1)
         )
         self.assertEqual(e1.type_and_code, (evdev.ecodes.EV_KEY, evdev.ecodes.BTN_LEFT))
+        # shared between events
+        self.assertIs(e1.type_and_code, InputEvent.btn_left().type_and_code)
 
         with self.assertRaises(
             FrozenInstanceError
@@ -104,6 +121,20 @@ class TestInputEvent(unittest.TestCase):
         with self.assertRaises(FrozenInstanceError):
             e1.value = 5
 
+    def test_slots(self):
+        e1 = InputEvent(1, 2, 3, 4, 5)
+        self.assertFalse(hasattr(e1, "__dict__"))
+
+        with self.assertRaises(FrozenInstanceError):
+            e1.foo = 5
+
+        e2 = pickle.loads(pickle.dumps(e1))
+        e3 = copy.deepcopy(e1)
+        for e in (e2, e3):
+            self.assertEqual(e, e1)
+            self.assertEqual(e.sec, 1)
+            self.assertEqual(e.usec, 2)
+
     def test_modify(self):
         e1 = InputEvent(1, 2, 3, 4, 5)
         e2 = e1.modify(value=6)
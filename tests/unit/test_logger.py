@@ -47,9 +47,12 @@ class TestLogger(unittest.TestCase):
         path = os.path.join(tmp, "logger-test")
         add_filehandler(path)
         logger.debug_key(((1, 2, 1),), "foo %s bar", 1234)
+        # repeated messages are only logged once
+        logger.debug_key(((1, 2, 1),), "foo %s bar", 1234)
         logger.debug_key(((1, 200, -1), (1, 5, 1)), "foo %s", (1, 2))
         with open(path, "r") as f:
             content = f.read().lower()
+            self.assertEqual(content.count("foo 1234 bar"), 1)
             self.assertIn(
                 "foo 1234 bar ·················· ((1, 2, 1))",
                 content,
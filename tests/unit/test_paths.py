@@ -24,6 +24,7 @@ from tests.test import quick_cleanup, tmp
 import os
 import unittest
 import tempfile
+from unittest.mock import patch
 
 from inputremapper.configs.paths import touch, mkdir, get_preset_path, get_config_path
 
@@ -60,6 +61,13 @@ class TestPaths(unittest.TestCase):
             get_preset_path("a", "b"), os.path.join(tmp, "presets/a/b.json")
         )
 
+        # cached results don't outlive changes of the config path
+        with patch("inputremapper.configs.paths.CONFIG_PATH", "/foo"):
+            self.assertEqual(get_preset_path("a", "b"), "/foo/presets/a/b.json")
+        self.assertEqual(
+            get_preset_path("a", "b"), os.path.join(tmp, "presets/a/b.json")
+        )
+
     def test_get_config_path(self):
         self.assertEqual(get_config_path(), tmp)
         self.assertEqual(get_config_path("a", "b"), os.path.join(tmp, "a/b"))
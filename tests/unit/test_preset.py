@@ -22,6 +22,7 @@
 from tests.test import tmp, quick_cleanup
 
 import os
+import stat
 import unittest
 import json
 from unittest.mock import patch
@@ -173,6 +174,22 @@ class TestMapping(unittest.TestCase):
         self.preset.load(get_preset_path("foo", "bar2"))
         self.assertIsNone(self.preset.get("a.b.c"))
 
+    def test_set_same_value(self):
+        self.preset.set("a.b", 1)
+        self.preset.set_has_unsaved_changes(False)
+
+        self.preset.set("a.b", 1)
+        self.assertFalse(self.preset.has_unsaved_changes())
+
+        self.preset.set("a.b", 2)
+        self.assertTrue(self.preset.has_unsaved_changes())
+
+        # the value of the fallback doesn't count as being set in the preset
+        self.preset.set_has_unsaved_changes(False)
+        pointer_speed = self.preset.get("gamepad.joystick.pointer_speed")
+        self.preset.set("gamepad.joystick.pointer_speed", pointer_speed)
+        self.assertTrue(self.preset.has_unsaved_changes())
+
     def test_fallback(self):
         global_config.set("d.e.f", 5)
         self.assertEqual(self.preset.get("d.e.f"), 5)
@@ -192,6 +209,8 @@ class TestMapping(unittest.TestCase):
 
         path = os.path.join(tmp, "presets", "Foo Device", "test.json")
         self.assertTrue(os.path.exists(path))
+        # the temporary file was moved into place
+        self.assertEqual(os.listdir(os.path.dirname(path)), ["test.json"])
 
         loaded = Preset()
         self.assertEqual(len(loaded), 0)
@@ -206,6 +225,74 @@ class TestMapping(unittest.TestCase):
         )
         self.assertEqual(loaded._config["foo"], "bar")
 
+    def test_save_load_without_orjson(self):
+        combination = EventCombination((EV_KEY, 10, 1), (EV_KEY, 11, 1))
+        self.preset.change(combination, "keyboard", "1")
+        self.preset._config["foo"] = "bar"
+
+        path = get_preset_path("Foo Device", "test")
+        with patch("inputremapper.configs.preset.orjson", None):
+            self.preset.save(path)
+
+        with open(path, "r") as file:
+            content = file.read()
+            self.assertTrue(content.endswith("}\n"))
+            self.assertEqual(
+                json.loads(content)["mapping"], {"1,10,1+1,11,1": ["1", "keyboard"]}
+            )
+
+        # files written with and without orjson can be read by both
+        loaded = Preset()
+        loaded.load(path)
+        self.assertEqual(loaded.get_mapping(combination), ("1", "keyboard"))
+        loaded.save(path)
+        with patch("inputremapper.configs.preset.orjson", None):
+            loaded.load(path)
+        self.assertEqual(loaded.get_mapping(combination), ("1", "keyboard"))
+        self.assertEqual(loaded._config["foo"], "bar")
+
+    def test_save_file_mode(self):
+        self.preset.change(EventCombination((EV_KEY, 10, 1)), "keyboard", "1")
+        path = get_preset_path("Foo Device", "test")
+
+        # new presets are only accessible by the user
+        self.preset.save(path)
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o600)
+
+        # the mode of existing presets is kept
+        os.chmod(path, 0o664)
+        self.preset.save(path)
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o664)
+
+    def test_save_symlink(self):
+        self.preset.change(EventCombination((EV_KEY, 10, 1)), "keyboard", "1")
+        target = os.path.join(tmp, "dotfiles", "test.json")
+        self.preset.save(target)
+
+        path = get_preset_path("Foo Device", "test")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.symlink(target, path)
+
+        self.preset.change(EventCombination((EV_KEY, 11, 1)), "keyboard", "2")
+        self.preset.save(path)
+        self.assertTrue(os.path.islink(path))
+        loaded = Preset()
+        loaded.load(target)
+        self.assertEqual(len(loaded), 2)
+
+    def test_save_removes_tmp_file(self):
+        self.preset.change(EventCombination((EV_KEY, 10, 1)), "keyboard", "1")
+        path = get_preset_path("Foo Device", "test")
+
+        def chown(_):
+            raise PermissionError
+
+        with patch("inputremapper.configs.preset.chown", chown):
+            self.assertRaises(PermissionError, self.preset.save, path)
+
+        self.assertFalse(os.path.exists(f"{path}.tmp"))
+        self.assertFalse(os.path.exists(path))
+
     def test_change(self):
         # the reader would not report values like 111 or 222, only 1 or -1.
         # the preset just does what it is told, so it accepts them.
@@ -290,6 +377,7 @@ class TestMapping(unittest.TestCase):
         self.assertEqual(self.preset.get_mapping(combi_2), ("a", "keyboard"))
         # since combi_1 and combi_2 are equivalent, a changes to b
         self.preset.change(combi_2, "keyboard", "b")
+        self.assertEqual(len(self.preset), 1)
         self.assertEqual(self.preset.get_mapping(combi_1), ("b", "keyboard"))
         self.assertEqual(self.preset.get_mapping(combi_2), ("b", "keyboard"))
 
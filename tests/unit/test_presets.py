@@ -154,6 +154,8 @@ class TestFindPresets(unittest.TestCase):
         os.makedirs(os.path.join(PRESETS, "1234"))
 
         os.mknod(os.path.join(PRESETS, "1234", "picture.png"))
+        os.mknod(os.path.join(PRESETS, "1234", ".hidden.json"))
+        os.makedirs(os.path.join(PRESETS, "1234", "folder.json"))
         self.assertEqual(len(get_presets("1234")), 0)
 
         os.mknod(os.path.join(PRESETS, "1234", "foo bar 1.json"))